@@ -15,17 +15,17 @@ if TYPE_CHECKING:
 try:
     from ._version import version as __version__  # type: ignore[unused-ignore,import-not-found]
 except ImportError:  # pragma: no cover
-    try:
-        import pkg_resources
+    from importlib.metadata import PackageNotFoundError, version
 
-        __version__ = pkg_resources.get_distribution(
-            "ansible_dev_environment",
-        ).version
-    except Exception:  # pylint: disable=broad-except # noqa: BLE001
+    try:
+        __version__ = version("repo_comp")
+    except PackageNotFoundError:
         # this is the fallback SemVer version picked by setuptools_scm when tag
         # information is not available.
         __version__ = "0.1.dev1"
 
+__all__ = ["ArgumentParser", "CustomHelpFormatter", "__version__", "parse_args"]
+
 
 def parse_args() -> argparse.Namespace:
     """Start parsing args passed from Cli.
@@ -96,12 +96,24 @@ def parse_args() -> argparse.Namespace:
         help="Ensure the repo is forked",
     )
 
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        default=False,
+        dest="yes",
+        help="Answer yes to all prompts",
+    )
+
     return parser.parse_args()
 
 
 class ArgumentParser(argparse.ArgumentParser):
     """A custom argument parser."""
 
+    _adding_argument: bool = False
+    _validation_formatter: HelpFormatter | None = None
+
     def add_argument(  # type: ignore[override]
         self: ArgumentParser,
         *args: Any,  # noqa: ANN401
@@ -118,7 +130,25 @@ class ArgumentParser(argparse.ArgumentParser):
         if "default" in kwargs and kwargs["default"] != "==SUPPRESS==":
             kwargs["help"] += f" (default: {kwargs['default']})"
         kwargs["help"] = kwargs["help"][0].upper() + kwargs["help"][1:]
-        super().add_argument(*args, **kwargs)
+        self._adding_argument = True
+        try:
+            super().add_argument(*args, **kwargs)
+        finally:
+            self._adding_argument = False
+
+    def _get_formatter(self: ArgumentParser) -> HelpFormatter:
+        """Get a help formatter, reusing one while arguments are being added.
+
+        Help output still gets a fresh formatter since it accumulates sections.
+
+        Returns:
+            The help formatter
+        """
+        if not self._adding_argument:
+            return super()._get_formatter()
+        if self._validation_formatter is None:
+            self._validation_formatter = super()._get_formatter()
+        return self._validation_formatter
 
 
 class CustomHelpFormatter(HelpFormatter):
@@ -1,19 +1,24 @@
 """Check the tox.ini file."""
 
-import difflib
+from __future__ import annotations
+
 import shutil
 
-from repo_comp.config import Config
+from typing import TYPE_CHECKING
+
 from repo_comp.utils import (
     ask_yes_no,
     get_commit_msg,
-    load_txt_file,
     path_to_data_file,
     render_diff,
     subprocess_run,
 )
 
 
+if TYPE_CHECKING:
+    from repo_comp.config import Config
+
+
 def run(config: Config) -> None:
     """Run the check.
 
@@ -21,15 +26,26 @@ def run(config: Config) -> None:
         config: The configuration data.
     """
     tox_init = path_to_data_file("tox.ini")
-    base_content = load_txt_file(tox_init).splitlines()
+    base_bytes = tox_init.read_bytes()
+    base_content: list[str] = []
     commit_msg = ""
     for repo in config.repos:
         config.output.info(f"[{repo.name}] Checking tox.ini...")
         repo_file = repo.work_dir.joinpath("tox.ini")
-        repo_content = repo_file.read_text().splitlines()
+        repo_bytes = repo_file.read_bytes()
+        if repo_bytes == base_bytes:
+            config.output.info(f"[{repo.name}] tox.ini in is correct.")
+            continue
+        # only decode when the raw bytes differ, line endings alone are not a change
+        if not base_content:
+            base_content = base_bytes.decode().splitlines()
+        repo_content = repo_bytes.decode().splitlines()
         if base_content == repo_content:
             config.output.info(f"[{repo.name}] tox.ini in is correct.")
             continue
+        # only needed once a difference is found
+        import difflib  # noqa: PLC0415
+
         diff = difflib.unified_diff(
             base_content,
             repo_content,
@@ -40,24 +56,28 @@ def run(config: Config) -> None:
         render_diff(diff)
         do_update = ask_yes_no(
             f"Do you want to update the tox.ini file in {repo.name}?",
+            config=config,
+            key="update",
         )
         if not do_update:
             continue
-        if not commit_msg:
-            commit_msg, commit_text_file = get_commit_msg(
+        reuse_commit = bool(commit_msg) and ask_yes_no(
+            "Do you want to reuse the commit message?",
+            config=config,
+            key="reuse",
+        )
+        if not reuse_commit:
+            edited = get_commit_msg(
                 config=config,
                 commit_msg=commit_msg,
             )
-        else:
-            reuse_commit = ask_yes_no("Do you want to reuse the commit message?")
-            if not reuse_commit:
-                commit_msg, commit_text_file = get_commit_msg(
-                    config=config,
-                    commit_msg=commit_msg,
-                )
+            if edited is None:
+                config.output.warning(f"[{repo.name}] Commit message not changed, skipping.")
+                continue
+            commit_msg, commit_text_file = edited
 
         new_branch = f"chore/tox_init_{config.session_id}"
-        command = f"git checkout -t -b {new_branch}"
+        command = ["git", "checkout", "-t", "-b", new_branch]
         msg = f"[{repo.name}] Creating a new tracking branch {new_branch}..."
         subprocess_run(
             command=command,
@@ -70,17 +90,8 @@ def run(config: Config) -> None:
         shutil.copy(tox_init, repo_file)
         config.output.info(f"[{repo.name}] Updated tox.ini.")
 
-        command = "git add tox.ini"
-        msg = f"[{repo.name}] Staging changes..."
-        subprocess_run(
-            command=command,
-            cwd=repo.work_dir,
-            msg=msg,
-            output=config.output,
-            verbose=config.args.verbose,
-        )
-
-        command = f"git commit --file {commit_text_file}"
+        # committing the path directly saves a separate git add
+        command = ["git", "commit", "--file", str(commit_text_file), "--", "tox.ini"]
         msg = f"[{repo.name}] Committing changes..."
         subprocess_run(
             command=command,
@@ -90,7 +101,7 @@ def run(config: Config) -> None:
             verbose=config.args.verbose,
         )
 
-        command = f"git push origin {new_branch}"
+        command = ["git", "push", "origin", new_branch]
         msg = f"[{repo.name}] Pushing changes to origin..."
         subprocess_run(
             command=command,
@@ -100,11 +111,21 @@ def run(config: Config) -> None:
             verbose=config.args.verbose,
         )
 
-        title = "chore: Update tox.ini"
-        command = (
-            f'gh pr create --repo {repo.upstream} --title "{title}"'
-            f" --base main --head {repo.origin_owner}:{new_branch} --body-file {commit_text_file}"
-        )
+        command = [
+            "gh",
+            "pr",
+            "create",
+            "--repo",
+            repo.upstream,
+            "--title",
+            "chore: Update tox.ini",
+            "--base",
+            "main",
+            "--head",
+            f"{repo.origin_owner}:{new_branch}",
+            "--body-file",
+            str(commit_text_file),
+        ]
         msg = f"[{repo.name}] Creating PR..."
         subprocess_run(
             command=command,
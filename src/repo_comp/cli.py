@@ -1,70 +1,113 @@
 """The cli entrypoint for the repo_comp package."""
 
+import logging
 import os
 import shutil
+import sys
 
-from repo_comp.args import parse_args
-from repo_comp.checks import tox_ini
+from repo_comp.args import __version__, parse_args
 from repo_comp.config import Config
 from repo_comp.output import Output, TermFeatures
 from repo_comp.repo import Repo
 from repo_comp.utils import load_toml_file, path_to_data_file, subprocess_run, tmp_path
 
 
-def fork_clone_all(config: Config) -> None:
-    """Fork all the repositories."""
-    for repo in config.repos:
-        if config.args.cf:
-            command = f"gh repo clone {repo.upstream_uri} -- --depth=1"
-            msg = f"[{repo.name}] Cloning from upstream..."
-            subprocess_run(
-                command=command,
-                cwd=config.tmp_path,
-                msg=msg,
-                output=config.output,
-                verbose=config.args.verbose,
-            )
-
-            command = "gh repo fork --remote=False"
-            msg = f"[{repo.name}] Ensuring fork is available..."
-            subprocess_run(
-                command=command,
-                cwd=config.tmp_path.joinpath(repo.name),
-                msg=msg,
-                output=config.output,
-                verbose=config.args.verbose,
-            )
-
-            shutil.rmtree(config.tmp_path.joinpath(repo.name))
-
-        msg = f"[{repo.name}] Cloning from origin..."
-        command = f"gh repo clone {repo.origin_uri} -- --depth=1"
+MAX_CLONE_WORKERS = 8
+
+# snapshot the environment variables used during startup
+_ENV = {key: os.environ.get(key) for key in ("EDITOR", "NO_COLOR")}
+
+
+def _clone_one(config: Config, repo: Repo) -> None:
+    """Fork and clone a single repository.
+
+    Args:
+        config: The configuration data.
+        repo: The repository to clone.
+    """
+    if config.args.cf:
+        command = ["gh", "repo", "clone", repo.upstream_uri, "--", "--depth=1"]
+        msg = f"[{repo.name}] Cloning from upstream..."
         subprocess_run(
             command=command,
             cwd=config.tmp_path,
             msg=msg,
             output=config.output,
             verbose=config.args.verbose,
+            spinner=False,
         )
 
-        repo.work_dir = config.tmp_path.joinpath(repo.name)
-
-        msg = f"[{repo.name}] Resetting to upstream/main..."
-        command = "git reset --hard upstream/main"
+        command = ["gh", "repo", "fork", "--remote=False"]
+        msg = f"[{repo.name}] Ensuring fork is available..."
         subprocess_run(
             command=command,
-            cwd=repo.work_dir,
+            cwd=config.tmp_path.joinpath(repo.name),
             msg=msg,
             output=config.output,
             verbose=config.args.verbose,
+            spinner=False,
         )
 
+        shutil.rmtree(config.tmp_path.joinpath(repo.name))
+
+    msg = f"[{repo.name}] Cloning from origin..."
+    command = ["gh", "repo", "clone", repo.origin_uri, "--", "--depth=1"]
+    subprocess_run(
+        command=command,
+        cwd=config.tmp_path,
+        msg=msg,
+        output=config.output,
+        verbose=config.args.verbose,
+        spinner=False,
+    )
+
+    repo.work_dir = config.tmp_path.joinpath(repo.name)
+
+    msg = f"[{repo.name}] Resetting to upstream/main..."
+    command = ["git", "reset", "--hard", "upstream/main"]
+    subprocess_run(
+        command=command,
+        cwd=repo.work_dir,
+        msg=msg,
+        output=config.output,
+        verbose=config.args.verbose,
+        spinner=False,
+    )
+
+
+def fork_clone_all(config: Config) -> None:
+    """Fork all the repositories.
+
+    Each repository is cloned in its own thread since the work is network bound,
+    spinners are disabled because they cannot share the terminal. At debug verbosity
+    the command output streams to the terminal, so the repositories are cloned one
+    at a time to keep it readable.
+
+    Args:
+        config: The configuration data.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    max_workers = max(1, min(MAX_CLONE_WORKERS, len(config.repos)))
+    if logging.ERROR - (config.args.verbose * 10) <= logging.DEBUG:
+        max_workers = 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda repo: _clone_one(config, repo), config.repos))
+
 
 def main() -> None:
     """Load the configuration data file."""
+    # Answer --version before building the parser or touching the filesystem,
+    # --help is handled by argparse before any of the setup below runs.
+    if "--version" in sys.argv[1:]:
+        print(__version__)  # noqa: T201
+        return
     args = parse_args()
+
+    from repo_comp.checks import tox_ini  # noqa: PLC0415
+
     term_features = TermFeatures(
-        color=False if os.environ.get("NO_COLOR") else not args.no_ansi,
+        color=False if _ENV["NO_COLOR"] else not args.no_ansi,
         links=not args.no_ansi,
     )
     output = Output(
@@ -80,7 +123,7 @@ def main() -> None:
     _tmp_path = tmp_path()
     output.info(f"Using temporary directory {_tmp_path}")
     repo_list = [Repo(name=k, **v[0]) for k, v in repos["repos"].items()]
-    editor = os.environ.get("EDITOR", "vi")
+    editor = _ENV["EDITOR"] or "vi"
     config = Config(
         args=args,
         editor=editor,
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import datetime
+import time
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from repo_comp.repo import Repo
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """The configuration data for the repo_comp package."""
 
@@ -26,9 +26,9 @@ class Config:
     repos: list[Repo] = None
     tmp_path: Path = None
     session_id: str = ""
+    commit_text_file: Path | None = None
+    auto_yes: set[str] = field(default_factory=set)
 
     def __post_init__(self: Config) -> None:
         """Post initialization."""
-        self.session_id = datetime.datetime.now(datetime.timezone.utc).strftime(
-            "%y%m%d-%H%M%S",
-        )
+        self.session_id = time.strftime("%y%m%d-%H%M%S", time.gmtime())
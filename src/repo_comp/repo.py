@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Repo:
     """A data structure for a repository."""
 
@@ -19,12 +19,12 @@ class Repo:
     name: str
 
     origin_uri: str = ""
-    upstream_uti: str = ""
+    upstream_uri: str = ""
     work_dir: Path = None
     origin_owner: str = ""
 
     def __post_init__(self: Repo) -> None:
         """Post initialization."""
         self.origin_uri = f"git@github.com:{self.origin}.git"
-        self.upstream_uri = f"git@github.com{self.upstream}.git"
+        self.upstream_uri = f"git@github.com:{self.upstream}.git"
         self.origin_owner = self.origin.split("/")[0]
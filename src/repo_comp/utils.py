@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-import importlib.resources
+import contextlib
+import functools
 import itertools
 import logging
+import os
+import shlex
 import subprocess
 import sys
 import tempfile
@@ -14,15 +17,13 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import subprocess_tee
-import tomllib
-
 from repo_comp.output import Color, Output, TermFeatures
 
 
 if TYPE_CHECKING:
     import difflib
 
+    from importlib.resources.abc import Traversable
     from types import TracebackType
 
     from repo_comp.config import Config
@@ -32,15 +33,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-def load_txt_file(file_path: Path) -> str:
-    """Load a text file.
-
-    Args:
-        file_path: The path to the text file.
-    """
-    with file_path.open(mode="r") as f:
-        return f.read()
+_DIFF_HEADER_COLORS = {
+    "---": Color.BRIGHT_MAGENTA,
+    "+++": Color.BRIGHT_CYAN,
+}
+_DIFF_LINE_COLORS = {
+    "-": Color.BRIGHT_RED,
+    "+": Color.BRIGHT_GREEN,
+    "@": Color.BRIGHT_YELLOW,
+}
 
 
 def load_toml_file(file_path: Path) -> dict:
@@ -49,10 +50,24 @@ def load_toml_file(file_path: Path) -> dict:
     Args:
         file_path: The path to the TOML file.
     """
+    import tomllib  # noqa: PLC0415
+
     with file_path.open(mode="rb") as f:
         return tomllib.load(f)
 
 
+@functools.cache
+def _data_dir() -> Traversable:
+    """Return the package data directory, resolved once per process.
+
+    Returns:
+        The data directory.
+    """
+    import importlib.resources  # noqa: PLC0415
+
+    return importlib.resources.files("repo_comp").joinpath("data")
+
+
 def path_to_data_file(name: str) -> Path:
     """Return the path to a data file.
 
@@ -62,8 +77,7 @@ def path_to_data_file(name: str) -> Path:
     Returns:
         The path to the data file.
     """
-    data_dir = importlib.resources.files("repo_comp").joinpath("data")
-    return data_dir.joinpath(name)
+    return _data_dir().joinpath(name)
 
 
 def tmp_path() -> Path:
@@ -73,7 +87,9 @@ def tmp_path() -> Path:
 
 def tmp_file() -> Path:
     """Return a temporary file."""
-    return Path(tempfile.mkstemp()[1])
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    return Path(path)
 
 
 def render_diff(diff: difflib.Differ) -> None:
@@ -82,20 +98,11 @@ def render_diff(diff: difflib.Differ) -> None:
     Args:
         diff: The diff object.
     """
+    lines = []
     for line in diff:
-        if line.startswith("---"):
-            color = Color.BRIGHT_MAGENTA
-        elif line.startswith("+++"):
-            color = Color.BRIGHT_CYAN
-        elif line.startswith("@@"):
-            color = Color.BRIGHT_YELLOW
-        elif line.startswith("-"):
-            color = Color.BRIGHT_RED
-        elif line.startswith("+"):
-            color = Color.BRIGHT_GREEN
-        else:
-            color = Color.GREY
-        print(f"{color}{line}{Color.END}")  # noqa: T201
+        color = _DIFF_HEADER_COLORS.get(line[:3]) or _DIFF_LINE_COLORS.get(line[:1], Color.GREY)
+        lines.append(f"{color}{line}{Color.END}\n")
+    sys.stdout.write("".join(lines))
 
 
 class Spinner:  # pylint: disable=too-many-instance-attributes
@@ -166,20 +173,19 @@ class Spinner:  # pylint: disable=too-many-instance-attributes
 
     def __enter__(self: Spinner) -> None:
         """Enter the context handler."""
-        # set the start time
-        self._start_time = time.time()
         if not self._term_features.any_enabled():
             return
+        # set the start time
+        self._start_time = time.time()
         if self._term_features.color:
             sys.stdout.write(f"{Color.GREY}{self.msg}:{Color.END} ")
         else:
             sys.stdout.write(f"{self.msg}: ")
         # hide the cursor
         sys.stdout.write("\033[?25l")
-        if self._term_features.any_enabled():
-            self.busy = True
-            self.thread = threading.Thread(target=self.spinner_task)
-            self.thread.start()
+        self.busy = True
+        self.thread = threading.Thread(target=self.spinner_task)
+        self.thread.start()
 
     def __exit__(
         self: Spinner,
@@ -196,91 +202,121 @@ class Spinner:  # pylint: disable=too-many-instance-attributes
 
 
         """
-        # delay if less than n seconds has elapsed
         if not self._term_features.any_enabled():
             return
+        # delay if less than n seconds has elapsed
         min_show_time = 0.5
         if self._start_time:
             elapsed = time.time() - self._start_time
             if elapsed < min_show_time:
                 time.sleep(min_show_time - elapsed)
-        if self._term_features.any_enabled():
-            self.busy = False
-            self.remove_spinner(cleanup=True)
-        else:
-            sys.stdout.write("\r")
+        self.busy = False
+        self.remove_spinner(cleanup=True)
         # show the cursor
         sys.stdout.write("\033[?25h")
 
 
 def subprocess_run(  # noqa: PLR0913
-    command: str,
+    command: list[str] | str,
     verbose: int,
     msg: str,
     output: Output,
     cwd: Path | None = None,
     env: dict[str, str] | None = None,
+    *,
+    spinner: bool = True,
 ) -> subprocess.CompletedProcess[str]:
     """Run a subprocess command.
 
     Args:
-        command: The command to run
+        command: The command to run, a string is split into arguments
         verbose: The verbosity level
         msg: The message to display
         output: The output object
         cwd: The current working directory
         env: The environment variables
+        spinner: Show a spinner while running, otherwise log the message
     Returns:
         The completed process
     """
-    cmd = f"Running command: {command}"
+    if isinstance(command, str):
+        command = shlex.split(command)
+    cmd = f"Running command: {shlex.join(command)}"
     output.debug(cmd)
     log_level = logging.ERROR - (verbose * 10)
     if log_level == logging.DEBUG:
-        return subprocess_tee.run(
+        # stream straight to the terminal, nothing is captured
+        return subprocess.run(  # noqa: S603
             command,
             check=True,
             cwd=cwd,
             env=env,
-            shell=True,  # noqa: S604
             text=True,
         )
-    with Spinner(message=msg, term_features=output.term_features):
-        return subprocess.run(
+    context: contextlib.AbstractContextManager[None]
+    if not spinner:
+        output.info(msg)
+        context = contextlib.nullcontext()
+    elif not output.term_features.any_enabled():
+        # nothing would be drawn, skip the spinner thread entirely
+        context = contextlib.nullcontext()
+    else:
+        context = Spinner(message=msg, term_features=output.term_features)
+    with context:
+        return subprocess.run(  # noqa: S603
             command,
             check=True,
             cwd=cwd,
             env=env,
-            shell=True,  # noqa: S602
             capture_output=True,
             text=True,
         )
 
 
-def ask_yes_no(question: str) -> bool:
+def ask_yes_no(question: str, config: Config, key: str) -> bool:
     """Ask a question.
 
+    Answering "a" says yes to this and every remaining question with the same key
+    in the session.
+
     Args:
         question: The question to ask
+        config: The configuration data
+        key: Identifies the kind of question for an "a" answer
     """
+    if config.args.yes or key in config.auto_yes:
+        return True
     answer = ""
-    while answer not in ["y", "n"]:
-        answer = input(f"{Color.BRIGHT_WHITE}{question} (y/n){Color.END}: ").lower()
+    while answer not in ["y", "n", "a"]:
+        answer = input(f"{Color.BRIGHT_WHITE}{question} (y/n/a){Color.END}: ").lower()
+    if answer == "a":
+        config.auto_yes.add(key)
+        return True
     if answer == "y":
         return True
     return False
 
 
-def get_commit_msg(config: Config, commit_msg: str) -> tuple(str, Path | None):
-    """Get the commit message."""
-    commit_text_file = tmp_file()
+def get_commit_msg(config: Config, commit_msg: str) -> tuple[str, Path] | None:
+    """Get the commit message.
+
+    The same commit message file is reused for the whole session.
+
+    Args:
+        config: The configuration data
+        commit_msg: The initial commit message
+
+    Returns:
+        The commit message and file, or None if the message was not changed
+    """
+    if config.commit_text_file is None:
+        config.commit_text_file = tmp_file()
+    commit_text_file = config.commit_text_file
     commit_text_file.write_text(commit_msg)
-    initial_ts = commit_text_file.stat().st_mtime
-    command = f"{config.editor} {commit_text_file}"
-    subprocess.Popen(args=command, shell=True).wait()
-    post_ts = commit_text_file.stat().st_mtime
-    with commit_text_file.open(mode="r") as f:
-        commit_msg = f.read().strip()
-    if initial_ts == post_ts:
+    command = [*shlex.split(config.editor), str(commit_text_file)]
+    subprocess.run(command, check=True)  # noqa: S603
+    # compare the content, mtime granularity can hide a quick edit
+    new_commit_msg = commit_text_file.read_text().strip()
+    if new_commit_msg == commit_msg.strip():
         return None
-    return commit_msg, commit_text_file
+    return new_commit_msg, commit_text_file